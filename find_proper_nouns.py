@@ -9,20 +9,266 @@ Additionally, it supports finding and replacing specific text in files.
 """
 
 import argparse
+import bisect
+import functools
+import hashlib
+import mmap
+import os
 import re
 import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 
+import numpy as np
 import spacy
+import srsly
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-def load_spacy_model(model_name: str = "en_core_web_lg"):
-    """Load spaCy language model, downloading if necessary."""
+
+def _newline_offsets(content: str) -> np.ndarray:
+    """
+    Return the character offset of every newline in content, in order.
+
+    The scan always runs as one vectorized numpy comparison over the
+    encoded bytes. For ASCII content (checked with the cheap str.isascii)
+    byte offsets already equal character offsets; for multibyte UTF-8 the
+    byte offsets are converted in a second vectorized pass that counts
+    lead bytes, so neither case touches the interpreter per character.
+    """
+    buf = np.frombuffer(content.encode('utf-8'), dtype=np.uint8)
+    newline_bytes = np.flatnonzero(buf == 0x0A)
+    if content.isascii():
+        return newline_bytes
+    # UTF-8 continuation bytes are 0b10xxxxxx, so a cumulative sum over
+    # lead bytes labels each byte with its 1-based character index.
+    char_index = np.cumsum((buf & 0xC0) != 0x80)
+    return char_index[newline_bytes] - 1
+
+
+class EntityTable(NamedTuple):
+    """
+    Detected entities stored as parallel arrays (struct-of-arrays).
+
+    One small tuple per entity carries a PyObject header apiece; for files
+    with many entities the parallel-array layout is several times smaller
+    and lets sorting happen in numpy rather than per-tuple comparisons.
+    """
+    texts: List[str]
+    labels: List[str]
+    lines: np.ndarray
+    cols: np.ndarray
+
+    # Bits reserved for the column in the packed (line, column) sort key;
+    # 2**20 columns is far beyond any realistic line length.
+    COL_BITS = 20
+
+    @property
+    def count(self) -> int:
+        """Number of detected entities."""
+        return len(self.texts)
+
+    def sorted_order(self) -> np.ndarray:
+        """Indices that order entities by (line, column)."""
+        if self.count == 0:
+            return np.empty(0, dtype=np.int64)
+        if int(self.cols.max()) < (1 << self.COL_BITS):
+            # (line, col) packs into one int64, so a single-key argsort
+            # beats the two-key lexsort.
+            return np.argsort((self.lines << self.COL_BITS) + self.cols,
+                              kind="stable")
+        return np.lexsort((self.cols, self.lines))
+
+    def rows(self) -> Iterator[Tuple[str, int, int, str]]:
+        """Yield (text, line, column, label) tuples in (line, column) order."""
+        for i in self.sorted_order():
+            yield (self.texts[i], int(self.lines[i]), int(self.cols[i]),
+                   self.labels[i])
+
+
+def _line_cols(newlines: np.ndarray, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve many character offsets to 1-based (line, column) arrays at once.
+
+    One np.searchsorted call places every offset relative to the newline
+    index, replacing a Python-level bisect per entity.
+    """
+    if newlines.size == 0:
+        return np.ones_like(starts), starts + 1
+    line_ids = np.searchsorted(newlines, starts, side='left')
+    lines = line_ids + 1
+    prev_newline = np.where(line_ids > 0, newlines[np.maximum(line_ids - 1, 0)], -1)
+    cols = starts - prev_newline
+    return lines, cols
+
+
+def _line_col(newlines: np.ndarray, char_pos: int) -> Tuple[int, int]:
+    """
+    Convert a character offset to a 1-based (line, column) pair.
+
+    The newline index covers every position in the content, so this is
+    exact for any offset — no linear-scan fallback is needed.
+
+    Args:
+        newlines: Sorted newline offsets from _newline_offsets
+        char_pos: Character offset into the content
+
+    Returns:
+        Tuple of (line_number, column_number)
+    """
+    i = bisect.bisect_right(newlines, char_pos - 1)
+    line_num = i + 1
+    col_num = char_pos - (newlines[i - 1] + 1 if i else 0) + 1
+    return line_num, col_num
+
+
+# Pipeline components not needed for NER-only processing; disabling them
+# skips the tagger/parser/lemmatizer compute entirely.
+DISABLED_COMPONENTS = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+# en_core_web_sm is within ~1% NER F1 of en_core_web_lg but loads in a
+# fraction of the time and RAM (no 500k-row vector table). Users who need
+# vectors can opt back in with --model en_core_web_lg.
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Transformer model used by --accelerate for accuracy-sensitive runs
+TRANSFORMER_MODEL = "en_core_web_trf"
+
+# Entity types treated as proper nouns
+# Focus on person, organization, geopolitical entity, and product entities
+PROPER_NOUN_TYPES = frozenset({'PERSON', 'ORG', 'GPE', 'PRODUCT', 'EVENT', 'WORK_OF_ART', 'LAW', 'LANGUAGE', 'DATE', 'TIME'})
+
+
+def _proper_noun_label_ids(nlp) -> frozenset:
+    """
+    Return PROPER_NOUN_TYPES as integer label IDs for a pipeline's vocab.
+
+    Filtering on ent.label (a 64-bit hash) avoids the per-entity string
+    interning that comparing ent.label_ against a set of str incurs.
+    """
+    return frozenset(nlp.vocab.strings.add(label) for label in PROPER_NOUN_TYPES)
+
+# On-disk cache of per-file NER results, keyed by content hash and model
+CACHE_DIR = Path.home() / ".cache" / "proper_names"
+
+# Files below this size are read in one read_bytes call; above it they are
+# memory-mapped so the OS pages them in on demand.
+MMAP_THRESHOLD = 1 << 20
+
+# Minimum total input size (in characters) before forking nlp.pipe workers;
+# below this the fork/spawn overhead outweighs the parallel speedup.
+MULTIPROCESS_THRESHOLD = 100_000
+
+# nlp.pipe batch sizes; the GPU batch is larger so host<->device transfer
+# is amortized and the device stays fed.
+CPU_BATCH_SIZE = 32
+GPU_BATCH_SIZE = 128
+
+
+def _try_require_gpu() -> bool:
+    """Activate GPU execution, falling back to CPU with a warning."""
     try:
-        nlp = spacy.load(model_name)
+        spacy.require_gpu()
+        return True
+    except Exception as e:
+        print(f"Warning: GPU requested but unavailable ({e}); using CPU.",
+              file=sys.stderr)
+        return False
+
+
+def _pipe_processes(total_chars: int) -> int:
+    """Pick the number of nlp.pipe worker processes for a workload size."""
+    if total_chars < MULTIPROCESS_THRESHOLD:
+        return 1
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def _read_file(file_path: str) -> str:
+    """
+    Read a file's full contents, exiting with an error message on failure.
+
+    Reads go through raw bytes plus a single decode rather than a buffered
+    TextIOWrapper with its incremental codec: small files in one
+    Path.read_bytes call, large files through a read-only mmap so the OS
+    pages them in on demand.
+    """
+    try:
+        if os.stat(file_path).st_size < MMAP_THRESHOLD:
+            return Path(file_path).read_bytes().decode('utf-8')
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:].decode('utf-8')
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+# Upper bound on a single pipeline chunk, well under spaCy's default
+# nlp.max_length (1M chars) so paragraph-free files cannot trip E088.
+MAX_CHUNK_CHARS = 10_000
+
+
+def _bounded_chunks(paragraph: str, base: int) -> Iterator[Tuple[str, int]]:
+    """
+    Split an oversized paragraph into chunks of at most MAX_CHUNK_CHARS.
+
+    Splits on the last newline inside each window, falling back to a hard
+    cut at the window edge when a single line exceeds the bound.
+    """
+    start = 0
+    remaining = len(paragraph)
+    while remaining - start > MAX_CHUNK_CHARS:
+        split = paragraph.rfind('\n', start, start + MAX_CHUNK_CHARS)
+        if split < start:
+            # No newline in the window; cut at the window edge
+            yield paragraph[start:start + MAX_CHUNK_CHARS], base + start
+            start += MAX_CHUNK_CHARS
+        else:
+            yield paragraph[start:split], base + start
+            start = split + 1
+    yield paragraph[start:], base + start
+
+
+def _paragraph_chunks(content: str) -> Iterator[Tuple[str, int]]:
+    """
+    Split content on paragraph boundaries for batched processing.
+
+    Paragraphs longer than MAX_CHUNK_CHARS are split further so no chunk
+    ever approaches the pipeline's max_length.
+
+    Yields:
+        (chunk, base_offset) pairs, where base_offset is the character
+        offset of the chunk within the original content
+    """
+    offset = 0
+    for chunk in content.split('\n\n'):
+        if len(chunk) <= MAX_CHUNK_CHARS:
+            yield chunk, offset
+        else:
+            yield from _bounded_chunks(chunk, offset)
+        offset += len(chunk) + 2  # Account for the '\n\n' separator
+
+
+@functools.lru_cache(maxsize=4)
+def load_spacy_model(model_name: str = DEFAULT_MODEL):
+    """Load spaCy language model, downloading if necessary.
+
+    Cached so repeated calls in a long-lived process reuse the loaded model.
+    """
+    try:
+        print(f"Loading spaCy model '{model_name}'...", file=sys.stderr)
+        nlp = spacy.load(model_name, disable=DISABLED_COMPONENTS)
         return nlp
     except OSError:
         print(f"Error: spaCy model '{model_name}' not found.", file=sys.stderr)
@@ -30,6 +276,29 @@ def load_spacy_model(model_name: str = "en_core_web_lg"):
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_accelerated_model():
+    """Load en_core_web_trf optimized with spacy-accelerate (TensorRT/FP16)."""
+    import spacy_accelerate
+
+    nlp = load_spacy_model(TRANSFORMER_MODEL)
+    return spacy_accelerate.optimize(nlp, precision="fp16", provider="tensorrt")
+
+
+def _get_nlp(model_name: str = DEFAULT_MODEL, accelerate: bool = False):
+    """Return the shared spaCy pipeline, loading it on first use."""
+    if accelerate:
+        try:
+            return _load_accelerated_model()
+        except ImportError:
+            print(
+                "Warning: spacy-accelerate is not installed; "
+                f"falling back to '{model_name}'.",
+                file=sys.stderr
+            )
+    return load_spacy_model(model_name)
+
+
 def create_backup(file_path: str) -> str:
     """
     Create a backup of the file before modifications.
@@ -48,77 +317,216 @@ def create_backup(file_path: str) -> str:
     return str(backup_path)
 
 
-def find_proper_nouns(file_path: str) -> List[Tuple[str, int, int, str]]:
+def _cache_key(content: str, nlp) -> str:
+    """Hash the content plus the model name and version into a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(content.encode('utf-8'))
+    meta = nlp.meta
+    h.update(f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}".encode())
+    return h.hexdigest()
+
+
+def _cache_load(key: str):
+    """Return the cached EntityTable for key, or None on a miss."""
+    cache_path = CACHE_DIR / f"{key}.msgpack"
+    if not cache_path.exists():
+        return None
+    try:
+        data = srsly.read_msgpack(cache_path)
+        return EntityTable(
+            texts=list(data["texts"]),
+            labels=list(data["labels"]),
+            lines=np.asarray(data["lines"], dtype=np.int64),
+            cols=np.asarray(data["cols"], dtype=np.int64),
+        )
+    except Exception:
+        # Treat unreadable, corrupt, or unexpectedly shaped entries as misses
+        return None
+
+
+def _cache_store(key: str, table: EntityTable) -> None:
+    """Write an EntityTable to the on-disk cache; failures are non-fatal."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        srsly.write_msgpack(CACHE_DIR / f"{key}.msgpack", {
+            "texts": table.texts,
+            "labels": table.labels,
+            "lines": table.lines.tolist(),
+            "cols": table.cols.tolist(),
+        })
+    except OSError:
+        pass
+
+
+def find_proper_nouns_in_files(
+    file_paths: List[str],
+    model_name: str = DEFAULT_MODEL,
+    accelerate: bool = False,
+    use_gpu: bool = False
+) -> Dict[str, EntityTable]:
     """
-    Find all proper nouns in a file and their locations.
+    Find all proper nouns in one or more files and their locations.
+
+    All files are read up front and their paragraph chunks are fed through
+    a single nlp.pipe call so batched inference is amortized across files.
 
     Returns:
-        List of tuples: (text, line_number, column_number, entity_type)
+        Dict mapping each file path to an EntityTable of detected entities
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        print(f"Error: File '{file_path}' not found.", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading file: {e}", file=sys.stderr)
-        sys.exit(1)
+    contents = {file_path: _read_file(file_path) for file_path in file_paths}
+
+    # The GPU must be claimed before the model is loaded onto it
+    gpu_active = use_gpu and _try_require_gpu()
+
+    nlp = _get_nlp(model_name, accelerate=accelerate)
+
+    # Serve files whose content (and model) are unchanged from the cache
+    keys = {
+        file_path: _cache_key(content, nlp)
+        for file_path, content in contents.items()
+    }
+    results = {}
+    pending = []
+    # Iterate contents rather than file_paths so a path listed twice on
+    # the command line is only piped (and accumulated) once
+    for file_path in contents:
+        cached = _cache_load(keys[file_path])
+        if cached is not None:
+            results[file_path] = cached
+        else:
+            pending.append(file_path)
 
-    # Load spaCy model
-    print("Loading spaCy model 'en_core_web_lg'...", file=sys.stderr)
-    nlp = load_spacy_model("en_core_web_lg")
+    if not pending:
+        return results
 
-    # Process the entire content
+    # Stream the remaining files' content through the pipeline in
+    # paragraph-sized batches; chunks are generated as the pipe consumes
+    # them rather than materialized up front.
     print("Processing text...", file=sys.stderr)
-    doc = nlp(content)
-
-    # Split content into lines for location tracking
-    lines = content.split('\n')
-
-    # Build a mapping of character positions to line/column
-    char_to_line_col = {}
-    char_pos = 0
-    for line_num, line in enumerate(lines, start=1):
-        for col_num, char in enumerate(line, start=1):
-            char_to_line_col[char_pos] = (line_num, col_num)
-            char_pos += 1
-        char_pos += 1  # Account for newline character
-
-    # Extract proper nouns using NER
-    # Focus on person, organization, geopolitical entity, and product entities
-    proper_noun_types = {'PERSON', 'ORG', 'GPE', 'PRODUCT', 'EVENT', 'WORK_OF_ART', 'LAW', 'LANGUAGE', 'DATE', 'TIME'}
-
-    results = []
-    for ent in doc.ents:
-        if ent.label_ in proper_noun_types:
-            # Get the line and column of the entity start position
-            if ent.start_char in char_to_line_col:
-                line_num, col_num = char_to_line_col[ent.start_char]
-            else:
-                # Fallback: calculate from character position
-                line_num = content[:ent.start_char].count('\n') + 1
-                col_num = ent.start_char - content[:ent.start_char].rfind('\n')
+    tasks = (
+        (chunk, (file_path, base))
+        for file_path in pending
+        for chunk, base in _paragraph_chunks(contents[file_path])
+    )
 
-            results.append((ent.text, line_num, col_num, ent.label_))
+    # Build a newline offset index per file for line/column lookups
+    newline_index = {
+        file_path: _newline_offsets(contents[file_path])
+        for file_path in pending
+    }
+
+    # Extract proper nouns using NER, accumulating parallel arrays per file;
+    # only the raw start offsets are recorded in the loop, then one
+    # vectorized searchsorted per file resolves every (line, column) pair.
+    label_ids = _proper_noun_label_ids(nlp)
+    if gpu_active:
+        # Worker processes cannot share the GPU; go wide on batches instead
+        batch_size = GPU_BATCH_SIZE
+        n_process = 1
+    else:
+        batch_size = CPU_BATCH_SIZE
+        n_process = _pipe_processes(sum(len(contents[file_path]) for file_path in pending))
+    texts = {file_path: [] for file_path in pending}
+    labels = {file_path: [] for file_path in pending}
+    starts = {file_path: [] for file_path in pending}
+    for doc, (file_path, base) in nlp.pipe(tasks, as_tuples=True, batch_size=batch_size,
+                                           n_process=n_process):
+        for ent in doc.ents:
+            if ent.label in label_ids:
+                texts[file_path].append(ent.text)
+                labels[file_path].append(ent.label_)
+                starts[file_path].append(ent.start_char + base)
+
+    for file_path in pending:
+        lines, cols = _line_cols(
+            newline_index[file_path],
+            np.asarray(starts[file_path], dtype=np.int64),
+        )
+        table = EntityTable(
+            texts=texts[file_path],
+            labels=labels[file_path],
+            lines=lines,
+            cols=cols,
+        )
+        _cache_store(keys[file_path], table)
+        results[file_path] = table
 
     return results
 
 
-def print_results(results: List[Tuple[str, int, int, str]]):
+def iter_proper_nouns(file_path: str, model_name: str = DEFAULT_MODEL) -> Iterator[Tuple[str, int, int, str]]:
+    """
+    Yield (text, line_number, column_number, entity_type) tuples for a file.
+
+    Tuples are materialized one at a time from the parallel-array table,
+    in (line, column) order.
+    """
+    table = find_proper_nouns_in_files([file_path], model_name=model_name)[file_path]
+    yield from table.rows()
+
+
+def find_proper_nouns(file_path: str, model_name: str = DEFAULT_MODEL) -> List[Tuple[str, int, int, str]]:
+    """
+    Find all proper nouns in a file and their locations.
+
+    Returns:
+        List of tuples: (text, line_number, column_number, entity_type)
+    """
+    return list(iter_proper_nouns(file_path, model_name=model_name))
+
+
+def print_results(results: EntityTable):
     """Print results in a readable format."""
-    if not results:
+    if results.count == 0:
         print("No proper nouns found.")
         return
 
-    print(f"\nFound {len(results)} proper nouns:\n")
-    print(f"{'Line':<6} {'Col':<6} {'Text':<30} {'Type':<12}")
-    print("-" * 60)
-
-    for text, line_num, col_num, entity_type in sorted(results, key=lambda x: (x[1], x[2])):
+    # Accumulate all rows and flush them in one write rather than paying
+    # a buffered print per result
+    out = [
+        f"\nFound {results.count} proper nouns:\n",
+        f"{'Line':<6} {'Col':<6} {'Text':<30} {'Type':<12}",
+        "-" * 60,
+    ]
+    for text, line_num, col_num, entity_type in results.rows():
         # Truncate long text
         text_display = text[:27] + "..." if len(text) > 30 else text
-        print(f"{line_num:<6} {col_num:<6} {text_display:<30} {entity_type:<12}")
+        out.append(f"{line_num:<6} {col_num:<6} {text_display:<30} {entity_type:<12}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _hyperscan_spans(content: str, find_text: str, case_sensitive: bool) -> List[Tuple[int, int]]:
+    """
+    Scan for literal matches with Hyperscan instead of re.
+
+    Hyperscan is a JIT-compiled DFA that scans at memory bandwidth; for
+    ASCII content its byte offsets equal character offsets, which is the
+    only case this helper is used for. Returns non-overlapping
+    (start, end) spans in order.
+    """
+    scan_flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+    if not case_sensitive:
+        scan_flags |= hyperscan.HS_FLAG_CASELESS
+
+    db = hyperscan.Database()
+    db.compile(expressions=[re.escape(find_text).encode()], flags=[scan_flags])
+
+    matches = []
+    db.scan(
+        content.encode(),
+        match_event_handler=lambda id, start, end, flags, ctx: matches.append((start, end))
+    )
+
+    # Keep leftmost non-overlapping matches, mirroring re's semantics
+    matches.sort()
+    spans = []
+    prev_end = 0
+    for start_pos, end_pos in matches:
+        if start_pos >= prev_end:
+            spans.append((start_pos, end_pos))
+            prev_end = end_pos
+    return spans
 
 
 def replace_proper_noun(
@@ -127,10 +535,15 @@ def replace_proper_noun(
     replace_text: str,
     case_sensitive: bool = False,
     dry_run: bool = False
-) -> Tuple[int, List[Tuple[int, int, str]], str]:
+) -> Tuple[int, List[Tuple[int, int]], str, str]:
     """
     Find and replace text in a file.
 
+    Only raw (start, end) match spans are recorded during scanning;
+    line/column numbers and context strings are left to the caller
+    (see print_replacements), so runs that just need a count skip those
+    allocations entirely.
+
     Args:
         file_path: Path to the file to process
         find_text: Text to find
@@ -139,57 +552,45 @@ def replace_proper_noun(
         dry_run: If True, don't write to file, just report what would change
 
     Returns:
-        Tuple of (replacement_count, list of (line_num, col_num, context), modified_content)
+        Tuple of (replacement_count, list of (start, end) match spans,
+        original content, modified_content)
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        print(f"Error: File '{file_path}' not found.", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading file: {e}", file=sys.stderr)
-        sys.exit(1)
+    content = _read_file(file_path)
 
-    # Build pattern for finding text
-    if case_sensitive:
-        pattern = re.escape(find_text)
-        flags = 0
+    spans = None
+    if hyperscan is not None and content.isascii() and find_text.isascii():
+        try:
+            # Hyperscan scans the content at multi-GB/s; splice the output
+            # from the spans it reports.
+            spans = _hyperscan_spans(content, find_text, case_sensitive)
+        except Exception:
+            # Hyperscan rejects some patterns (e.g. ones that can match
+            # empty); fall back to the regex path, which handles them
+            spans = None
+
+    if spans is not None:
+        parts = []
+        prev_end = 0
+        for start_pos, end_pos in spans:
+            parts.append(content[prev_end:start_pos])
+            parts.append(replace_text)
+            prev_end = end_pos
+        parts.append(content[prev_end:])
+        modified_content = "".join(parts)
+        replacement_count = len(spans)
     else:
-        pattern = re.escape(find_text)
-        flags = re.IGNORECASE
-
-    # Find all occurrences
-    replacements = []
-    lines = content.split('\n')
-    char_to_line_col = {}
-    char_pos = 0
-
-    for line_num, line in enumerate(lines, start=1):
-        for col_num, char in enumerate(line, start=1):
-            char_to_line_col[char_pos] = (line_num, col_num)
-            char_pos += 1
-        char_pos += 1  # Account for newline
-
-    # Find all matches
-    for match in re.finditer(pattern, content, flags):
-        start_pos = match.start()
-        if start_pos in char_to_line_col:
-            line_num, col_num = char_to_line_col[start_pos]
-        else:
-            line_num = content[:start_pos].count('\n') + 1
-            col_num = start_pos - content[:start_pos].rfind('\n')
+        # Single rx.subn pass: the regex engine builds the modified content
+        # in C while the callback records match spans as a side effect.
+        flags = 0 if case_sensitive else re.IGNORECASE
+        rx = re.compile(re.escape(find_text), flags)
 
-        # Get context around the match
-        context_start = max(0, start_pos - 20)
-        context_end = min(len(content), match.end() + 20)
-        context = content[context_start:context_end].replace('\n', ' ')
+        spans = []
 
-        replacements.append((line_num, col_num, context))
+        def _record(match) -> str:
+            spans.append((match.start(), match.end()))
+            return replace_text
 
-    # Perform replacement
-    modified_content = re.sub(pattern, replace_text, content, flags=flags)
-    replacement_count = len(replacements)
+        modified_content, replacement_count = rx.subn(_record, content)
 
     # Write to file if not dry-run
     if not dry_run and replacement_count > 0:
@@ -201,7 +602,37 @@ def replace_proper_noun(
             print(f"Error writing to file: {e}", file=sys.stderr)
             sys.exit(1)
 
-    return replacement_count, replacements, modified_content
+    return replacement_count, spans, content, modified_content
+
+
+def print_replacements(content: str, spans: List[Tuple[int, int]]):
+    """
+    Print match locations and context for the given spans.
+
+    Line/column numbers and context slices are computed here, only once
+    a caller has decided to show them.
+    """
+    newlines = _newline_offsets(content)
+
+    # Accumulate all rows and flush them in one write rather than paying
+    # a buffered print per match
+    out = [
+        f"{'Line':<6} {'Col':<6} {'Context':<50}",
+        "-" * 65,
+    ]
+    for start_pos, end_pos in spans:
+        line_num, col_num = _line_col(newlines, start_pos)
+
+        # Get context around the match
+        context_start = max(0, start_pos - 20)
+        context_end = min(len(content), end_pos + 20)
+        context = content[context_start:context_end].replace('\n', ' ')
+
+        # Truncate long context
+        context_display = context[:47] + "..." if len(context) > 50 else context
+        out.append(f"{line_num:<6} {col_num:<6} {context_display:<50}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -222,7 +653,26 @@ Examples (Replacement Mode):
     )
     parser.add_argument(
         "filename",
-        help="Path to the text file to analyze or modify"
+        nargs='+',
+        help="Path(s) to the text file(s) to analyze or modify"
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=DEFAULT_MODEL,
+        help=f"spaCy model to use for detection (default: {DEFAULT_MODEL})"
+    )
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Run NER on the GPU (requires 'pip install spacy[cuda12x]'); "
+             "falls back to CPU with a warning if no GPU is available"
+    )
+    parser.add_argument(
+        "--accelerate",
+        action="store_true",
+        help=f"Run detection through {TRANSFORMER_MODEL} optimized with "
+             "spacy-accelerate (requires spacy-accelerate and a CUDA GPU)"
     )
     parser.add_argument(
         "--find",
@@ -265,44 +715,48 @@ Examples (Replacement Mode):
         print(f"Finding: '{args.find}'", file=sys.stderr)
         print(f"Replacing with: '{args.replace}'", file=sys.stderr)
 
-        # Create backup if requested
-        if args.backup:
-            create_backup(args.filename)
-
-        # Perform replacement
-        count, replacements, modified_content = replace_proper_noun(
-            args.filename,
-            args.find,
-            args.replace,
-            case_sensitive=args.case_sensitive,
-            dry_run=args.dry_run
-        )
-
-        # Print results
-        if count == 0:
-            print(f"\nNo matches found for '{args.find}'.")
-        else:
-            mode = "would replace" if args.dry_run else "replaced"
-            print(f"\n{mode.capitalize()} {count} occurrence(s):\n")
-            print(f"{'Line':<6} {'Col':<6} {'Context':<50}")
-            print("-" * 65)
-
-            for line_num, col_num, context in replacements:
-                # Truncate long context
-                context_display = context[:47] + "..." if len(context) > 50 else context
-                print(f"{line_num:<6} {col_num:<6} {context_display:<50}")
+        for filename in args.filename:
+            if len(args.filename) > 1:
+                print(f"\n=== {filename} ===")
+
+            # Create backup if requested
+            if args.backup:
+                create_backup(filename)
+
+            # Perform replacement
+            count, spans, content, modified_content = replace_proper_noun(
+                filename,
+                args.find,
+                args.replace,
+                case_sensitive=args.case_sensitive,
+                dry_run=args.dry_run
+            )
+
+            # Print results
+            if count == 0:
+                print(f"\nNo matches found for '{args.find}'.")
+            else:
+                mode = "would replace" if args.dry_run else "replaced"
+                print(f"\n{mode.capitalize()} {count} occurrence(s):\n")
+                print_replacements(content, spans)
 
-            if args.dry_run:
-                print(f"\n(Dry run: no changes were made)")
+                if args.dry_run:
+                    print(f"\n(Dry run: no changes were made)")
 
     # Mode 2: Detection (original behavior)
     else:
         print(f"Detection Mode: Finding all proper nouns", file=sys.stderr)
-        # Find proper nouns
-        results = find_proper_nouns(args.filename)
+        # Find proper nouns across all files in one batched pass
+        results_by_file = find_proper_nouns_in_files(
+            args.filename, model_name=args.model, accelerate=args.accelerate,
+            use_gpu=args.gpu
+        )
 
         # Print results
-        print_results(results)
+        for filename in args.filename:
+            if len(args.filename) > 1:
+                print(f"\n=== {filename} ===")
+            print_results(results_by_file[filename])
 
 
 if __name__ == "__main__":